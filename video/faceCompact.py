@@ -0,0 +1,172 @@
+import argparse
+import os
+import shutil
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+
+from faceRecognition import DEDUP_THRESHOLD, dhash, hamming_distance
+
+
+def cluster_hashes(hashes: List[int], threshold: int) -> List[List[int]]:
+    """
+    Group image hashes into clusters of near-duplicates.
+
+    Args:
+        hashes (List[int]): Perceptual hashes, one per image.
+        threshold (int): Max bit difference for an image to join an existing cluster.
+
+    Returns:
+        List[List[int]]: Clusters as lists of indices into hashes; the first index is the cluster leader.
+    """
+    clusters: List[List[int]] = []
+    for i, image_hash in enumerate(hashes):
+        for cluster in clusters:
+            if hamming_distance(image_hash, hashes[cluster[0]]) <= threshold:
+                cluster.append(i)
+                break
+        else:
+            clusters.append([i])
+    return clusters
+
+
+def select_representatives(hashes: List[int], clusters: List[List[int]], max_images: int) -> List[int]:
+    """
+    Pick up to max_images diverse images, starting from the cluster leaders.
+
+    Leaders of the largest clusters are taken first; once every cluster is covered,
+    the image farthest from everything already selected is added until the cap is met.
+
+    Args:
+        hashes (List[int]): Perceptual hashes, one per image.
+        clusters (List[List[int]]): Output of cluster_hashes.
+        max_images (int): Cap on the number of representatives.
+
+    Returns:
+        List[int]: Indices into hashes of the images to keep.
+    """
+    if max_images <= 0 or not hashes:
+        return []
+
+    leaders = [cluster[0] for cluster in sorted(clusters, key=len, reverse=True)]
+    if len(leaders) >= max_images:
+        # More clusters than the cap allows: spread the picks out among the leaders
+        candidates = leaders[1:]
+        selected = [leaders[0]]
+    else:
+        leader_set = set(leaders)
+        candidates = [i for i in range(len(hashes)) if i not in leader_set]
+        selected = leaders
+
+    # Farthest-point sampling: distance from each candidate to its nearest selected image
+    min_dist = {i: min(hamming_distance(hashes[i], hashes[j]) for j in selected) for i in candidates}
+    while len(selected) < max_images and min_dist:
+        farthest = max(min_dist, key=min_dist.get)
+        selected.append(farthest)
+        del min_dist[farthest]
+        for i in min_dist:
+            min_dist[i] = min(min_dist[i], hamming_distance(hashes[i], hashes[farthest]))
+    return selected
+
+
+def compact_person(person_path: str, max_images: int, threshold: int,
+                   archive_path: Optional[str] = None,
+                   min_images: int = 20) -> Tuple[int, int]:
+    """
+    Compact one person's gallery down to a capped, diverse set of images.
+
+    Args:
+        person_path (str): Folder holding the person's face images.
+        max_images (int): Cap on the number of images to keep.
+        threshold (int): Max bit difference treated as a near-duplicate.
+        archive_path (Optional[str]): Folder to move discarded images into; deleted if None.
+        min_images (int): Leave the gallery untouched if it has this many images or fewer.
+
+    Returns:
+        Tuple[int, int]: Number of images before and after compaction.
+    """
+    names, hashes = [], []
+    for image_name in sorted(os.listdir(person_path)):
+        img = cv2.imread(os.path.join(person_path, image_name))
+        if img is not None:
+            names.append(image_name)
+            hashes.append(dhash(img))
+
+    if len(names) <= min_images:
+        return len(names), len(names)
+
+    clusters = cluster_hashes(hashes, threshold)
+    keep = set(select_representatives(hashes, clusters, max_images))
+
+    if archive_path is not None:
+        os.makedirs(archive_path, exist_ok=True)
+    for i, image_name in enumerate(names):
+        if i in keep:
+            continue
+        image_path = os.path.join(person_path, image_name)
+        if archive_path is not None:
+            shutil.move(image_path, os.path.join(archive_path, image_name))
+        else:
+            os.remove(image_path)
+
+    return len(names), len(keep)
+
+
+def compact_gallery(folder: str = "faces", max_images: int = 50, threshold: int = DEDUP_THRESHOLD,
+                    archive_folder: Optional[str] = "faces_archive",
+                    min_images: int = 20) -> Dict[str, Tuple[int, int]]:
+    """
+    Compact every person's gallery in a dataset folder.
+
+    Args:
+        folder (str): Path to the dataset folder.
+        max_images (int): Cap on the number of images kept per person.
+        threshold (int): Max bit difference treated as a near-duplicate.
+        archive_folder (Optional[str]): Where discarded images are moved; deleted if None.
+        min_images (int): Skip any person whose gallery has this many images or fewer.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Person name -> (images before, images after).
+    """
+    if max_images < min_images:
+        raise ValueError(f"max_images ({max_images}) must be at least min_images ({min_images})")
+
+    results = {}
+    for person_name in os.listdir(folder):
+        person_path = os.path.join(folder, person_name)
+        if not os.path.isdir(person_path):
+            continue
+
+        archive_path = os.path.join(archive_folder, person_name) if archive_folder is not None else None
+        before, after = compact_person(person_path, max_images, threshold, archive_path, min_images)
+        results[person_name] = (before, after)
+        print(f"{person_name}: {before} -> {after} images")
+
+    total_before = sum(before for before, _ in results.values())
+    total_after = sum(after for _, after in results.values())
+    print(f"Total: {total_before} -> {total_after} images")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compact each person's face gallery to a capped, diverse set.")
+    parser.add_argument("folder", nargs="?", default="faces", help="dataset folder (default: faces)")
+    parser.add_argument("--max-images", type=int, default=50, help="images kept per person (default: 50)")
+    parser.add_argument("--min-images", type=int, default=20,
+                        help="skip people with this many images or fewer (default: 20)")
+    parser.add_argument("--threshold", type=int, default=DEDUP_THRESHOLD,
+                        help=f"max dHash bit difference treated as a duplicate (default: {DEDUP_THRESHOLD})")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--archive", default="faces_archive",
+                       help="folder to move discarded images into (default: faces_archive)")
+    group.add_argument("--delete", action="store_true", help="delete discarded images instead of archiving")
+    args = parser.parse_args()
+    if args.max_images < args.min_images:
+        parser.error("--max-images must be at least --min-images")
+    if not args.delete and not args.archive:
+        parser.error("--archive needs a folder; use --delete to remove discarded images")
+
+    compact_gallery(args.folder, args.max_images, args.threshold,
+                    None if args.delete else args.archive, args.min_images)
+    print("Retrain the model (press 't' in faceDetection.py) to use the compacted gallery.")
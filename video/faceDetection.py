@@ -4,10 +4,10 @@ import numpy as np
 import time
 from pathlib import Path
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
 
 # Replace this with your actual import
-from faceRecognition import FaceRecognizer
+from faceRecognition import FaceRecognizer, DEDUP_THRESHOLD, dhash, hamming_distance
 
 
 class FaceDetector:
@@ -152,9 +152,66 @@ class FaceDetector:
         if on_dismount:
             self.on_face_dismount = on_dismount
 
+class MotionGate:
+    def __init__(self, sample_size: Tuple[int, int] = (64, 48),
+                 pixel_threshold: int = 25,
+                 motion_fraction: float = 0.01,
+                 hold_time: float = 2.0,
+                 idle_detect_interval: float = 1.0) -> None:
+        self.sample_size = sample_size
+        self.pixel_threshold = pixel_threshold
+        self.motion_fraction = motion_fraction  # Fraction of changed pixels that counts as motion
+        self.hold_time = hold_time  # Stay at full rate this long after the last motion
+        self.idle_detect_interval = idle_detect_interval  # Seconds between detections while idle
+        self.enabled = True
+
+        self.previous_sample = None
+        self.last_motion_time = 0
+        self.last_idle_detect_time = 0
+
+    def has_motion(self, frame: np.ndarray) -> bool:
+        """Compare a downsampled copy of the frame against the previous one."""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        sample = cv2.resize(gray, self.sample_size, interpolation=cv2.INTER_AREA)
+        sample = cv2.GaussianBlur(sample, (5, 5), 0)
+
+        previous = self.previous_sample
+        self.previous_sample = sample
+        if previous is None:
+            return True
+
+        diff = cv2.absdiff(sample, previous)
+        changed = np.count_nonzero(diff > self.pixel_threshold)
+        return changed > self.motion_fraction * diff.size
+
+    def should_detect(self, frame: np.ndarray, track_active: bool) -> bool:
+        """Decide whether to run face detection on this frame."""
+        now = time.time()
+        if self.has_motion(frame):
+            self.last_motion_time = now
+
+        if not self.enabled or track_active or now - self.last_motion_time < self.hold_time:
+            return True
+
+        # Idle: static scene and no active track, so only detect at a low rate
+        if now - self.last_idle_detect_time >= self.idle_detect_interval:
+            self.last_idle_detect_time = now
+            return True
+        return False
+
+    def is_idle(self, track_active: bool) -> bool:
+        """Whether detection is currently throttled to the idle rate."""
+        return (self.enabled and not track_active and
+                time.time() - self.last_motion_time >= self.hold_time)
+
 class FaceRecorder:
-    def __init__(self, save_interval: float = 0.2) -> None:
+    def __init__(self, save_interval: float = 0.2,
+                 dedup_threshold: int = DEDUP_THRESHOLD,
+                 dedup_history: int = 20) -> None:
         self.save_interval = save_interval
+        self.dedup_threshold = dedup_threshold  # Max hash bit difference counted as a duplicate
+        self.dedup_history = dedup_history
+        self.recent_hashes = dict()  # person dir name -> deque of recent image hashes
         self.last_save_time = 0
         self.is_saving = False
         self.current_person = 0
@@ -226,17 +283,41 @@ class FaceRecorder:
         if current_time - self.last_save_time < self.save_interval:
             return
 
+        if frame is None or frame.size == 0:
+            return
+
         faces_dir = Path("faces")
         person_dir = faces_dir / f"person_{self.current_person}"
         person_dir.mkdir(parents=True, exist_ok=True)
 
+        # Skip near-duplicates of this person's recent images
+        image_hash = dhash(frame)
+        recent = self._get_recent_hashes(person_dir)
+        if any(hamming_distance(image_hash, h) <= self.dedup_threshold for h in recent):
+            self.last_save_time = current_time
+            return
+
         timestamp = int(time.time() * 1000)
         image_path = person_dir / f"{timestamp}.jpg"
         cv2.imwrite(str(image_path), frame)
         print(f"Saved face image to {image_path}")
+        recent.append(image_hash)
         
         self.last_save_time = current_time
 
+    def _get_recent_hashes(self, person_dir: Path) -> deque:
+        """Return the recent-hash history for a person, seeding it from the newest images on disk."""
+        key = person_dir.name
+        if key not in self.recent_hashes:
+            recent = deque(maxlen=self.dedup_history)
+            existing = sorted(person_dir.glob("*.jpg"))[-self.dedup_history:]
+            for image_path in existing:
+                img = cv2.imread(str(image_path))
+                if img is not None:
+                    recent.append(dhash(img))
+            self.recent_hashes[key] = recent
+        return self.recent_hashes[key]
+
 # Globals for face recognition
 face_recognition_enabled = True  # Toggle with 'f'
 
@@ -334,6 +415,7 @@ def main() -> None:
         return
 
     detector = FaceDetector()
+    motion_gate = MotionGate()
     recognizer = FaceRecognizer()
 
     with FaceRecorder() as recorder:
@@ -365,8 +447,11 @@ def main() -> None:
                 # Keep a clean copy for usage (saving or recording)
                 clean_frame = frame.copy()
 
-                # Detect the largest face
-                largest_face = detector.detect_faces(frame)
+                # Detect the largest face (at a low rate when idle on a static scene)
+                if motion_gate.should_detect(frame, detector.last_detection_id is not None):
+                    largest_face = detector.detect_faces(frame)
+                else:
+                    largest_face = None
                 current_face_id = detector.last_detection_id
 
                 # If we have a currently active face_id, attempt recognition polling
@@ -452,8 +537,13 @@ def main() -> None:
                 
                 recording_status = "Recording: ON" if recorder.recording_enabled else "Recording: OFF"
                 recognition_status = "Recognition: ON" if face_recognition_enabled else "Recognition: OFF"
+                if not motion_gate.enabled:
+                    idle_status = "Idle mode: OFF"
+                else:
+                    idle_status = "Idle mode: IDLE" if motion_gate.is_idle(detector.last_detection_id is not None) else "Idle mode: ACTIVE"
                 cv2.putText(frame, recording_status, (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
                 cv2.putText(frame, recognition_status, (10, 90), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+                cv2.putText(frame, idle_status, (10, 120), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
 
                 cv2.imshow('Face Detection', frame)
 
@@ -468,6 +558,9 @@ def main() -> None:
                 elif key == ord('f'):  # Toggle face recognition
                     face_recognition_enabled = not face_recognition_enabled
                     print(f"Face recognition {'enabled' if face_recognition_enabled else 'disabled'}")
+                elif key == ord('m'):  # Toggle motion-gated idle mode
+                    motion_gate.enabled = not motion_gate.enabled
+                    print(f"Idle mode {'enabled' if motion_gate.enabled else 'disabled'}")
                 elif key == ord('a'):
                     recorder.current_person -= 1
                 elif key == ord('s'):
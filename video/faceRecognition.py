@@ -3,6 +3,31 @@ import os
 import numpy as np
 from typing import List, Tuple, Dict, Union
 
+# Max dHash bit difference at which two face images count as near-duplicates
+DEDUP_THRESHOLD = 6
+
+
+def dhash(image: np.ndarray, hash_size: int = 8) -> int:
+    """
+    Compute a difference hash (dHash) of an image.
+
+    Args:
+        image (np.ndarray): BGR or grayscale image.
+        hash_size (int): Side length of the hash grid; the hash has hash_size**2 bits.
+
+    Returns:
+        int: Perceptual hash where visually similar images differ in few bits.
+    """
+    gray = image if len(image.shape) == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    resized = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    diff = resized[:, 1:] > resized[:, :-1]
+    return int(np.packbits(diff.flatten()).tobytes().hex(), 16)
+
+
+def hamming_distance(hash_a: int, hash_b: int) -> int:
+    """Number of differing bits between two perceptual hashes."""
+    return bin(hash_a ^ hash_b).count("1")
+
 
 class FaceRecognizer:
     def __init__(self):